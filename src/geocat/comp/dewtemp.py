@@ -21,33 +21,38 @@ def dewtemp(temperature, relative_humidity):
                     Dewpoint temperature in Kelvin. Same size as input variable temperature
     """
 
-    # If xarray input, pull data and store metadata
-    x_out = False
-    if isinstance(temperature, xr.DataArray):
-        x_out = True
-        save_dims = temperature.dims
-        save_coords = temperature.coords
-        save_attrs = temperature.attrs
-
-    # ensure in numpy array for function call
-    temperature = np.asarray(temperature)
-    relative_humidity = np.asarray(relative_humidity)
-
     # make sure the input arrays are of the same size
     if np.shape(temperature) != np.shape(relative_humidity):
         raise ValueError(
             f"dewtemp_trh: dimensions of temperature, {np.shape(temperature)}, and relative_humidity, "
             f"{np.shape(relative_humidity)}, do not match")
 
-    # Call mapblocks to run function
-    dew_pnt_temp = _dewtemp(temperature, relative_humidity)
+    # If xarray input, let xarray apply the computation so that Dask-backed data
+    # stays lazy and the metadata of temperature is carried to the output
+    if isinstance(temperature, xr.DataArray):
+        if isinstance(relative_humidity, xr.DataArray):
+            relative_humidity = relative_humidity.data
+        relative_humidity = xr.DataArray(relative_humidity,
+                                         dims=temperature.dims)
+
+        # Unlike its attributes, the output does not take the name of
+        # temperature
+        dtype = np.result_type(temperature.dtype, relative_humidity.dtype,
+                               np.float32)
+        dew_pnt_temp = xr.apply_ufunc(_dewtemp,
+                                      temperature,
+                                      relative_humidity,
+                                      dask="parallelized",
+                                      output_dtypes=[dtype],
+                                      keep_attrs=True)
+
+        return dew_pnt_temp.rename(None)
+
+    # ensure in numpy array for function call
+    temperature = np.asarray(temperature)
+    relative_humidity = np.asarray(relative_humidity)
 
-    # output as xarray if input as xarray
-    if x_out:
-        dew_pnt_temp = xr.DataArray(data=dew_pnt_temp,
-                                    coords=save_coords,
-                                    dims=save_dims,
-                                    attrs=save_attrs)
+    dew_pnt_temp = _dewtemp(temperature, relative_humidity)
 
     return dew_pnt_temp
 
@@ -183,9 +183,7 @@ def eofunc_eofs(data,
     if meta:
         dims = ["eof"
                ] + [data.dims[i] for i in range(data.ndim) if i != time_dim]
-        coords = {
-            k: v for (k, v) in data.coords.items() if k != data.dims[time_dim]
-        }
+        coords = data.isel({data.dims[time_dim]: 0}, drop=True).coords
     else:
         dims = ["eof"] + [f"dim_{i}" for i in range(data.ndim) if i != time_dim]
         coords = {}
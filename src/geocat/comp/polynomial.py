@@ -1,3 +1,4 @@
+from functools import partial
 from typing import Iterable, Any
 
 import dask.array as da
@@ -115,8 +116,9 @@ def ndpolyfit(x: Iterable,
 
     Returns
     -------
-    coefficients : :class:`xarray.DataArray` or :class:`numpy.ndarray`
-        An array containing the coefficients of the fitted polynomial.
+    coefficients : :class:`xarray.DataArray` or :class:`numpy.ndarray` or :class:`dask.array.Array`
+        An array containing the coefficients of the fitted polynomial. If `y` is a Dask array, the coefficients are
+        returned as a lazy Dask array; call `.compute()` or `.persist()` on it to evaluate.
 
     Examples
     --------
@@ -235,31 +237,72 @@ def ndpolyfit(x: Iterable,
     if isinstance(y, np.ndarray):
         return _ndpolyfit(x, y, axis, deg, rcond, full, w, cov, missing_value)
     if isinstance(y, xr.DataArray):
-        output = _ndpolyfit(x, y.data, axis, deg, rcond, full, w, cov,
-                            missing_value)
-        attrs = output.attrs
-
+        if isinstance(y.data, da.Array):
+            # Dask-backed data stays lazy and goes through `map_blocks` below,
+            # while NumPy-backed data is fitted directly without a task graph.
+            p = ndpolyfit(x,
+                          y.data,
+                          deg,
+                          axis,
+                          rcond=rcond,
+                          full=full,
+                          w=w,
+                          cov=cov,
+                          missing_value=missing_value)
+            attrs = _polyfit_attrs(deg, rcond, full, w, cov)
+        else:
+            output = _ndpolyfit(x, y.data, axis, deg, rcond, full, w, cov,
+                                missing_value)
+            if not meta:
+                return output
+            p = output.data
+            attrs = output.attrs
+
+        # The output is built in a single step with all of its metadata
         if meta:
-            for attr, v in y.attrs.items():
-                attrs[attr] = v
+            attrs.update(y.attrs)
             axis = axis if axis >= 0 else axis + y.ndim
-            dims = [("poly_coef" if i == axis else output.dims[i])
-                    for i in range(y.ndim)]
-            coords = {k: v for k, v in y.coords.items() if k != y.dims[axis]}
+            dims = [
+                ("poly_coef" if i == axis else y.dims[i]) for i in range(y.ndim)
+            ]
+            # Selecting along `axis` with `drop=True` discards every coordinate
+            # that depends on the fitted dimension and keeps all the others.
+            coords = dict(y.isel({y.dims[axis]: 0}, drop=True).coords)
             coords["poly_coef"] = list(range(int(deg) + 1))
-            output = xr.DataArray(output.data,
-                                  attrs=attrs,
-                                  dims=dims,
-                                  coords=coords)
+            output = xr.DataArray(p, attrs=attrs, dims=dims, coords=coords)
+        else:
+            output = xr.DataArray(p, attrs=attrs)
+
+        # xarray would otherwise name the output after the Dask graph key
+        output.name = None
         return output
     if isinstance(y, da.Array):
+        axis = _check_axis(axis, y.ndim)
+        # Validate up front, as the kernel itself only runs at compute time
+        deg = _check_fit_args(x, y.shape[axis], deg)
         y = _unchunk_ifneeded(y, axis)
 
-        return y.map_blocks(lambda b: _ndpolyfit(x, b, axis, deg, rcond, full,
-                                                 w, cov, missing_value, False),
-                            dtype=np.float64).compute()
+        # The fitted coefficients replace the `axis` dimension, so the output
+        # chunks must be declared explicitly for the result to stay lazy.
+        p_chunks = list(y.chunks)
+        p_chunks[axis] = (deg + 1,)
+
+        # `x` and the fitting options are the same for every block; bind them
+        # once as constants rather than capturing them in a per-call lambda.
+        return y.map_blocks(partial(_ndpolyfit, x),
+                            axis=axis,
+                            deg=deg,
+                            rcond=rcond,
+                            full=full,
+                            w=w,
+                            cov=cov,
+                            missing_value=missing_value,
+                            xarray_output=False,
+                            chunks=tuple(p_chunks),
+                            dtype=np.float64,
+                            meta=np.empty((0,) * y.ndim, dtype=np.float64))
     else:
-        return _ndpolyfit(np.asarray(y), x, axis, deg, rcond, full, w, cov,
+        return _ndpolyfit(x, np.asarray(y), axis, deg, rcond, full, w, cov,
                           missing_value)
 
 
@@ -330,26 +373,10 @@ def _ndpolyfit(x: np.ndarray,
 
     axis = _check_axis(axis, y.ndim)
 
-    if x.size != y.shape[axis]:
-        raise ValueError(
-            "X must have the same number of elements as the y-dimension defined by axis"
-        )
-
-    if x.shape not in ((y.shape[axis],), (y.shape[axis], 1), (1,
-                                                              y.shape[axis])):
-        raise ValueError(
-            "x must be of size (M,), (M, 1), or (1, M); where M = y.shape[axis]"
-        )
+    deg = _check_fit_args(x, y.shape[axis], deg)
 
     x = x.reshape(y.shape[axis])
 
-    if deg < 0:
-        raise ValueError("deg must be zero or a positive integer.")
-    elif int(deg) != deg:
-        raise TypeError("deg must be an integral type.")
-
-    deg = int(deg)
-
     y_rearranged, trailing_shape = _rearrange_axis(y, axis)
 
     if not np.isnan(missing_value):
@@ -376,27 +403,24 @@ def _ndpolyfit(x: np.ndarray,
         raise ValueError("x cannot have missing values")
 
     if has_missing:
-        tmp_results = []
-
-        for c in range(y_rearranged.shape[1]):
-            idx = np.logical_not(mask[:, c])
-            tmp_results.append(
-                np.polyfit(x[idx],
-                           y_rearranged[idx, c],
-                           deg=deg,
-                           rcond=rcond,
-                           full=full,
-                           w=w,
-                           cov=cov))
-
-        polyfit_output = tmp_results[0].reshape((-1, 1)) if isinstance(
-            tmp_results[0], np.ndarray) else tmp_results[0][0].reshape((-1, 1))
-        for i in range(1, y_rearranged.shape[1]):
-            polyfit_output = np.concatenate(
-                (polyfit_output, (tmp_results[c].reshape((-1, 1)) if isinstance(
-                    tmp_results[c], np.ndarray) else tmp_results[c][0].reshape(
-                        (-1, 1)))),
-                axis=1)
+        # Each series is fitted on its own valid points. Transposing once makes
+        # every series a contiguous row, and the coefficients are written into
+        # a preallocated array instead of being concatenated column by column.
+        y_series = np.ascontiguousarray(y_rearranged.T)
+        valid = np.logical_not(mask.T)
+        polyfit_output = np.empty((deg + 1, y_series.shape[0]))
+
+        for c in range(y_series.shape[0]):
+            idx = valid[c]
+            tmp_result = np.polyfit(x[idx],
+                                    y_series[c, idx],
+                                    deg=deg,
+                                    rcond=rcond,
+                                    full=full,
+                                    w=w,
+                                    cov=cov)
+            polyfit_output[:, c] = tmp_result if isinstance(
+                tmp_result, np.ndarray) else tmp_result[0]
 
     else:
         polyfit_output = np.polyfit(x,
@@ -412,13 +436,7 @@ def _ndpolyfit(x: np.ndarray,
                                 trailing_shape)
 
     if bool(xarray_output):
-        attrs = {
-            "deg": deg,
-            "provided_rcond": rcond,
-            "full": full,
-            "weights": w,
-            "covariance": cov
-        }
+        attrs = _polyfit_attrs(deg, rcond, full, w, cov)
 
         if not has_missing:
             if full:  # full == True
@@ -434,6 +452,42 @@ def _ndpolyfit(x: np.ndarray,
         return p
 
 
+def _polyfit_attrs(deg: int, rcond, full, w, cov) -> dict:
+    """
+    Returns the attributes describing a polynomial fit, shared by every output of `ndpolyfit` that carries them.
+    """
+    return {
+        "deg": int(deg),
+        "provided_rcond": rcond,
+        "full": full,
+        "weights": w,
+        "covariance": cov
+    }
+
+
+def _check_fit_args(x: np.ndarray, m: int, deg) -> int:
+    """
+    Validates the abscissa and the degree passed to `_ndpolyfit`, where `m` is the number of elements of `y` along
+    the fitted axis, and returns `deg` as an `int`.
+    """
+    if x.size != m:
+        raise ValueError(
+            "X must have the same number of elements as the y-dimension defined by axis"
+        )
+
+    if x.shape not in ((m,), (m, 1), (1, m)):
+        raise ValueError(
+            "x must be of size (M,), (M, 1), or (1, M); where M = y.shape[axis]"
+        )
+
+    if deg < 0:
+        raise ValueError("deg must be zero or a positive integer.")
+    elif int(deg) != deg:
+        raise TypeError("deg must be an integral type.")
+
+    return int(deg)
+
+
 def _check_axis(axis, ndim) -> int:
     if (axis > (ndim - 1)) or (axis < -ndim):
         raise ValueError(
@@ -516,7 +570,8 @@ def ndpolyval(p: Iterable, x: Iterable, axis: int = 0, **kwargs):
     ----------
 
     p : :class:`Iterable`
-        Polynomial coeficients.
+        Polynomial coeficients. It could be a Dask array, e.g. the lazy output of `ndpolyfit` for Dask input, in which
+        case the evaluation is lazy as well.
 
     x : :class:`Iterable`
         Coordinates where polynomial must be evaluated.
@@ -525,12 +580,21 @@ def ndpolyval(p: Iterable, x: Iterable, axis: int = 0, **kwargs):
         The axis along which to evaluate the polynomial.
 
     **kwargs:
-        Currently not used.
+        Extra parameters controlling the method behavior:
+
+        dtype : :class:`numpy.dtype`, `optional`
+            Floating point type of the output, of at least single precision. `p` and `x` are cast to it before
+            evaluation, so e.g. `np.float32` halves the memory traffic of large evaluations at the cost of precision.
+            Default is `np.float64`.
+
+        return_info : :class:`bool`, `optional`
+            If set to `True`, `p` is attached to the output as an attribute. Default is `False`.
 
     Returns
     -------
     output : :class:`xr.DataArray`
-        Polynomial evaluated with the provided coordinates.
+        Polynomial evaluated with the provided coordinates. If `x` is a Dask array, the output wraps a lazy Dask
+        array; call `.compute()` or `.persist()` on it to evaluate.
 
     Examples
     --------
@@ -618,25 +682,68 @@ def ndpolyval(p: Iterable, x: Iterable, axis: int = 0, **kwargs):
         ValueError: x has invalid shape.
 
     """
-    p_ndarr = _to_numpy_ndarray(p)
-    axis = _check_axis(axis, p_ndarr.ndim)
-    if isinstance(x, da.Array):
+    dtype = np.dtype(kwargs.get("dtype", np.float64))
+    if not (np.issubdtype(dtype, np.floating) and dtype.itemsize >= 4):
+        raise TypeError(
+            "dtype must be a floating point type of at least single precision.")
+    p_data = p.data if isinstance(p, xr.DataArray) else p
+    x_data = x.data if isinstance(x, xr.DataArray) else x
+
+    if isinstance(p_data, da.Array) or isinstance(x_data, da.Array):
+        # If either input is lazy the evaluation stays lazy, so coefficients
+        # returned by `ndpolyfit` for Dask data are not computed here and the
+        # fit and the evaluation end up in a single task graph.
+        p_dask = da.asarray(p_data).astype(dtype, copy=False)
+        x = da.asarray(x_data).astype(dtype, copy=False)
+        axis = _check_axis(axis, p_dask.ndim)
+        # Same rules as `_ndpolyval`, which only sees the blocks of `x`
+        if (x.ndim != 1) and (x.ndim != p_dask.ndim):
+            raise ValueError(
+                "x has invalid number of dimension. x must be either 1 dimensionn."
+            )
+        x_is_vector = x.ndim != p_dask.ndim
+        if not x_is_vector and (x.shape[:axis] != p_dask.shape[:axis] or
+                                x.shape[axis + 1:] != p_dask.shape[axis + 1:]):
+            raise ValueError("x has invalid shape.")
+        if x_is_vector:
+            # A vector `x` is laid along `axis` and lazily broadcast to the
+            # output shape; it is then rechunked below so that its blocks
+            # line up with those of `p` rather than `p` being merged into
+            # the single block `broadcast_to` leaves on every other dimension.
+            x_shape = [1] * p_dask.ndim
+            x_shape[axis] = x.size
+            y_shape = list(p_dask.shape)
+            y_shape[axis] = x.size
+            x = da.broadcast_to(x.reshape(x_shape), y_shape)
+        if x_is_vector or not isinstance(x_data, da.Array):
+            x_chunks = list(p_dask.chunks)
+            x_chunks[axis] = -1
+            x = x.rechunk(tuple(x_chunks))
         x = _unchunk_ifneeded(x, axis)
-        x_chunks = list(x.chunks)
-        x_chunks[axis] = p_ndarr.shape[axis]
-        p_dask = da.from_array(p_ndarr, chunks=x_chunks)
-        y = da.map_blocks(
-            lambda p_blocks, x_blocks: _ndpolyval(p_blocks, x_blocks, axis),
-            p_dask,
-            x,
-            dtype=np.float64).compute()
+
+        # `p` follows the chunking of `x` except along `axis`, where it holds
+        # the coefficients in a single chunk. The output has the chunks of `x`.
+        p_chunks = list(x.chunks)
+        p_chunks[axis] = (p_dask.shape[axis],)
+        p_dask = p_dask.rechunk(tuple(p_chunks))
+        y = da.map_blocks(_ndpolyval,
+                          p_dask,
+                          x,
+                          axis=axis,
+                          dtype=dtype,
+                          chunks=x.chunks,
+                          meta=np.empty((0,) * p_dask.ndim, dtype=dtype))
     else:
-        x_ndarr = _to_numpy_ndarray(x)
+        p_ndarr = _to_numpy_ndarray(p_data).astype(dtype, copy=False)
+        axis = _check_axis(axis, p_ndarr.ndim)
+        x_ndarr = _to_numpy_ndarray(x_data).astype(dtype, copy=False)
         y = _ndpolyval(p_ndarr, x_ndarr, axis)
 
     attrs = {"p": p} if kwargs.get("return_info", False) else {}
 
     output = xr.DataArray(y, attrs=attrs)
+    # xarray would otherwise name the output after the Dask graph key
+    output.name = None
     return output
 
 
@@ -657,21 +764,28 @@ def _ndpolyval(p: np.ndarray,
             "x has invalid number of dimension. x must be either 1 dimensionn.")
 
     if isvector(x):
-        x_original_size = x.size
-        other_dims = np.asarray(p.shape)[np.arange(p.ndim) != axis]
-        x = np.moveaxis(
-            np.tile(x.reshape((-1,)), np.prod(other_dims)).reshape(
-                (*other_dims, x_original_size)), -1, axis)
+        # Lay `x` along `axis` and let it broadcast against `p`, rather than
+        # materializing a copy of it tiled over every other dimension.
+        x_shape = [1] * p.ndim
+        x_shape[axis] = x.size
+        x = x.reshape(x_shape)
 
     else:
         if not (np.all(x.shape[:axis] == p.shape[:axis]) and np.all(
                 x.shape[(axis + 1):x.ndim] == p.shape[(axis + 1):p.ndim])):
             raise ValueError("x has invalid shape.")
 
-    y = np.zeros(x.shape)
+    y_shape = list(p.shape)
+    y_shape[axis] = x.shape[axis]
+    # Horner's scheme, evaluated in the floating point precision of the inputs
+    # with one multiply-add per coefficient after the leading one and no
+    # np.power
+    y = np.broadcast_to(p.take([0], axis=axis), y_shape).astype(
+        np.result_type(p.dtype, x.dtype, np.float32))
 
-    for i in range(p.shape[axis]):
-        y += p.take([i], axis=axis) * np.power(x, p.shape[axis] - 1 - i)
+    for i in range(1, p.shape[axis]):
+        y *= x
+        y += p.take([i], axis=axis)
 
     return y
 
@@ -699,6 +813,9 @@ def detrend(data: Iterable, deg=1, axis=0, **kwargs):
 
         return_info (:class:`bool`)
             If set to true, the fitted polynomial is returned as part of the attributes. Default value is `True`.
+            For Dask-backed `data` the polynomial, like the output, is lazy and `.compute()` on the output does not
+            evaluate it; use `dask.compute(detrended_data, detrended_data.attrs["p"])` to evaluate both in a single
+            pass over the fit.
 
         missing_value (:class:`numeric`)
             A value that must be ignored. Default is NaN.
@@ -27,33 +27,24 @@ def relhum(temperature, mixing_ratio, pressure):
                     Relative humidity. Will have the same dimensions as temperature
         """
 
-    # If xarray input, pull data and store metadata
-    x_out = False
+    # ensure all inputs same size
+    if np.shape(temperature) != np.shape(mixing_ratio) or np.shape(
+            temperature) != np.shape(pressure):
+        raise ValueError(f"relhum: dimensions of inputs are not the same")
+
+    # If xarray input, let xarray apply the computation so that Dask-backed data
+    # stays lazy and the metadata of temperature is carried to the output
     if isinstance(temperature, xr.DataArray):
-        x_out = True
-        save_dims = temperature.dims
-        save_coords = temperature.coords
-        save_attrs = temperature.attrs
+        return _xrelhum(_relhum, np.float64, temperature, mixing_ratio,
+                        pressure)
 
     # ensure in numpy array for function call
     temperature = np.asarray(temperature)
     mixing_ratio = np.asarray(mixing_ratio)
     pressure = np.asarray(pressure)
 
-    # ensure all inputs same size
-    if np.shape(temperature) != np.shape(mixing_ratio) or np.shape(
-            temperature) != np.shape(pressure):
-        raise ValueError(f"relhum: dimensions of inputs are not the same")
-
     relative_humidity = _relhum(temperature, mixing_ratio, pressure)
 
-    # output as xarray if input as xarray
-    if x_out:
-        relative_humidity = xr.DataArray(data=relative_humidity,
-                                         coords=save_coords,
-                                         dims=save_dims,
-                                         attrs=save_attrs)
-
     return relative_humidity
 
 
@@ -85,33 +76,24 @@ def relhum_water(temperature, mixing_ratio, pressure):
                 Relative humidity. Will have the same dimensions as temperature
     """
 
-    # If xarray input, pull data and store metadata
-    x_out = False
+    # ensure all inputs same size
+    if np.shape(temperature) != np.shape(mixing_ratio) or np.shape(
+            temperature) != np.shape(pressure):
+        raise ValueError(f"relhum_water: dimensions of inputs are not the same")
+
+    # If xarray input, let xarray apply the computation so that Dask-backed data
+    # stays lazy and the metadata of temperature is carried to the output
     if isinstance(temperature, xr.DataArray):
-        x_out = True
-        save_dims = temperature.dims
-        save_coords = temperature.coords
-        save_attrs = temperature.attrs
+        return _xrelhum(_relhum_water, np.float32, temperature, mixing_ratio,
+                        pressure)
 
     # ensure in numpy array for function call
     temperature = np.asarray(temperature)
     mixing_ratio = np.asarray(mixing_ratio)
     pressure = np.asarray(pressure)
 
-    # ensure all inputs same size
-    if np.shape(temperature) != np.shape(mixing_ratio) or np.shape(
-            temperature) != np.shape(pressure):
-        raise ValueError(f"relhum_water: dimensions of inputs are not the same")
-
     relative_humidity = _relhum_water(temperature, mixing_ratio, pressure)
 
-    # output as xarray if input as xarray
-    if x_out:
-        relative_humidity = xr.DataArray(data=relative_humidity,
-                                         coords=save_coords,
-                                         dims=save_dims,
-                                         attrs=save_attrs)
-
     return relative_humidity
 
 
@@ -140,36 +122,73 @@ def relhum_ice(temperature, mixing_ratio, pressure):
                     Relative humidity. Will have the same dimensions as temperature
         """
 
-    # If xarray input, pull data and store metadata
-    x_out = False
+    # ensure all inputs same size
+    if np.shape(temperature) != np.shape(mixing_ratio) or np.shape(
+            temperature) != np.shape(pressure):
+        raise ValueError(f"relhum_ice: dimensions of inputs are not the same")
+
+    # If xarray input, let xarray apply the computation so that Dask-backed data
+    # stays lazy and the metadata of temperature is carried to the output
     if isinstance(temperature, xr.DataArray):
-        x_out = True
-        save_dims = temperature.dims
-        save_coords = temperature.coords
-        save_attrs = temperature.attrs
+        return _xrelhum(_relhum_ice, np.float32, temperature, mixing_ratio,
+                        pressure)
 
     # ensure in numpy array for function call
     temperature = np.asarray(temperature)
     mixing_ratio = np.asarray(mixing_ratio)
     pressure = np.asarray(pressure)
 
-    # ensure all inputs same size
-    if np.shape(temperature) != np.shape(mixing_ratio) or np.shape(
-            temperature) != np.shape(pressure):
-        raise ValueError(f"relhum_ice: dimensions of inputs are not the same")
-
     relative_humidity = _relhum_ice(temperature, mixing_ratio, pressure)
 
-    # output as xarray if input as xarray
-    if x_out:
-        relative_humidity = xr.DataArray(data=relative_humidity,
-                                         coords=save_coords,
-                                         dims=save_dims,
-                                         attrs=save_attrs)
-
     return relative_humidity
 
 
+def _xrelhum(kernel, dtype, temperature, mixing_ratio, pressure):
+    """ Applies one of the relative humidity kernels to xarray input, lazily if the data is Dask-backed.
+
+            Args:
+
+                kernel (:obj:`callable`):
+                    One of `_relhum`, `_relhum_water`, or `_relhum_ice`
+
+                dtype (:class:`numpy.dtype`):
+                    The lowest floating point precision `kernel` computes in
+
+                temperature (:class:`xr.DataArray`):
+                    Temperature in Kelvin
+
+                mixing_ratio (:class:`numpy.ndarray`, :class:`xr.DataArray`, :obj:`list`, or :obj:`float`):
+                    Mixing ratio in kg/kg. Must have the same dimensions as temperature
+
+                pressure (:class:`numpy.ndarray`, :class:`xr.DataArray`, :obj:`list`, or :obj:`float`):
+                    Pressure in Pa. Must have the same dimensions as temperature
+
+            Returns:
+
+                relative_humidity (:class:`xr.DataArray`):
+                    Relative humidity, with the dimensions, coordinates, and attributes but not the name of temperature
+        """
+
+    if isinstance(mixing_ratio, xr.DataArray):
+        mixing_ratio = mixing_ratio.data
+    mixing_ratio = xr.DataArray(mixing_ratio, dims=temperature.dims)
+    if isinstance(pressure, xr.DataArray):
+        pressure = pressure.data
+    pressure = xr.DataArray(pressure, dims=temperature.dims)
+
+    dtype = np.result_type(temperature.dtype, mixing_ratio.dtype,
+                           pressure.dtype, dtype)
+    relative_humidity = xr.apply_ufunc(kernel,
+                                       temperature,
+                                       mixing_ratio,
+                                       pressure,
+                                       dask="parallelized",
+                                       output_dtypes=[dtype],
+                                       keep_attrs=True)
+
+    return relative_humidity.rename(None)
+
+
 def _relhum(t, w, p):
     """ Calculates relative humidity with respect to ice, given temperature, mixing ratio, and pressure.
 
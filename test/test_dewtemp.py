@@ -50,6 +50,24 @@ class Test_dewtemp(unittest.TestCase):
 
         assert np.allclose(dewtemp(tk, rh) - 273.15, dt_2, 0.1)
 
+    def test_xarray_dask_input(self):
+        tk = xr.DataArray(da.from_array(np.asarray(t_def) + 273.15, chunks=6),
+                          name="temperature",
+                          attrs={"units": "K"})
+        rh = xr.DataArray(da.from_array(rh_def, chunks=6))
+
+        out = dewtemp(tk, rh)
+
+        assert isinstance(out.data, da.Array)
+        assert out.name is None
+        assert out.attrs == {"units": "K"}
+        assert np.allclose(out - 273.15, dt_2, 0.1)
+
+        out = dewtemp(tk.astype(np.float32), rh.astype(np.float32))
+
+        assert out.dtype == np.float32
+        assert out.values.dtype == np.float32
+
     def test_dask_unchunked_input(self):
         tk = da.from_array(np.asarray(t_def) + 273.15)
         rh = da.from_array(rh_def)
@@ -1,4 +1,5 @@
 from abc import ABCMeta
+import pathlib
 from unittest import TestCase
 import numpy as np
 import numpy.testing as nt
@@ -7,6 +8,15 @@ import xarray as xr
 
 from geocat.comp import (eofunc_eofs, eofunc_pcs, eofunc, eofunc_ts)
 
+# Shared by _sample_data[ 2 ] and _sample_data[ 3 ]; -99 marks missing values
+_TMP_DATA = np.asarray([
+    0, 1, -99, -99, 4, -99, 6, -99, 8, 9, 10, -99, 12, -99, 14, 15, 16, -99, 18,
+    -99, 20, 21, 22, -99, 24, 25, 26, 27, 28, -99, 30, -99, 32, 33, 34, 35, 36,
+    -99, 38, 39, 40, -99, 42, -99, 44, 45, 46, -99, 48, 49, 50, 51, 52, 53, 54,
+    55, 56, 57, 58, 59, 60, 61, 62, 63
+],
+                       dtype='double').reshape((4, 4, 4))
+
 
 class BaseEOFTestClass(metaclass=ABCMeta):
     _sample_data_eof = []
@@ -25,34 +35,16 @@ class BaseEOFTestClass(metaclass=ABCMeta):
     _sample_data_eof.append(np.arange(64, dtype='double').reshape((4, 4, 4)))
 
     # _sample_data[ 2 ]
-    tmp_data = np.asarray([
-        0, 1, -99, -99, 4, -99, 6, -99, 8, 9, 10, -99, 12, -99, 14, 15, 16, -99,
-        18, -99, 20, 21, 22, -99, 24, 25, 26, 27, 28, -99, 30, -99, 32, 33, 34,
-        35, 36, -99, 38, 39, 40, -99, 42, -99, 44, 45, 46, -99, 48, 49, 50, 51,
-        52, 53, 54, 55, 56, 57, 58, 59, 60, 61, 62, 63
-    ],
-                          dtype='double').reshape((4, 4, 4))
-    _sample_data_eof.append(tmp_data)
+    _sample_data_eof.append(_TMP_DATA)
 
     # _sample_data[ 3 ]
-    tmp_data = np.asarray([
-        0, 1, -99, -99, 4, -99, 6, -99, 8, 9, 10, -99, 12, -99, 14, 15, 16, -99,
-        18, -99, 20, 21, 22, -99, 24, 25, 26, 27, 28, -99, 30, -99, 32, 33, 34,
-        35, 36, -99, 38, 39, 40, -99, 42, -99, 44, 45, 46, -99, 48, 49, 50, 51,
-        52, 53, 54, 55, 56, 57, 58, 59, 60, 61, 62, 63
-    ],
-                          dtype='double').reshape((4, 4, 4))
+    tmp_data = _TMP_DATA.copy()
     tmp_data[tmp_data == -99] = np.nan
     _sample_data_eof.append(tmp_data)
 
     # _sample_data[ 4 ]
     _sample_data_eof.append(np.arange(64, dtype='int64').reshape((4, 4, 4)))
 
-    try:
-        _nc_ds = xr.open_dataset("sst.nc")
-    except:
-        _nc_ds = xr.open_dataset("test/sst.nc")
-
     _num_attrs = 4
 
     expected_output = np.full((1, 4, 4), 0.25)
@@ -291,6 +283,16 @@ class Test_eof(TestCase, BaseEOFTestClass):
 
 class Test_eof_ts(TestCase, BaseEOFTestClass):
 
+    @classmethod
+    def setUpClass(cls):
+        # Opened lazily and only for the tests that need it
+        cls._nc_ds = xr.open_dataset(pathlib.Path(__file__).parent / "sst.nc",
+                                     chunks={"time": -1})
+
+    @classmethod
+    def tearDownClass(cls):
+        cls._nc_ds.close()
+
     def test_01(self):
         sst = self._nc_ds.sst
         evec = self._nc_ds.evec
@@ -3,6 +3,7 @@ from geocat.comp.polynomial import _ndpolyfit, ndpolyfit, _ndpolyval, ndpolyval,
 
 import numpy as np
 import xarray as xr
+import dask
 import dask.array as da
 
 
@@ -204,6 +205,15 @@ class test_internal_ndpolyfit(TestCase):
         p = _ndpolyfit(x, y, missing_value=5)
         np.testing.assert_almost_equal(p, [[1.0, 1.0], [0.0, 0.0]])
 
+    def test_17(self):
+        x = np.arange(10).astype(dtype=np.float)
+        y = np.stack((2 * x + 3, -x + 1, 5 * x), axis=1)
+        y[2, 0] = np.nan
+        y[5, 1] = np.nan
+
+        p = _ndpolyfit(x, y)
+        np.testing.assert_almost_equal(p, [[2.0, -1.0, 5.0], [3.0, 1.0, 0.0]])
+
 
 class test_ndpolyfit(TestCase):
 
@@ -328,6 +338,40 @@ class test_ndpolyfit(TestCase):
 
             np.testing.assert_almost_equal(expected_p, actual_p)
 
+    def test_9(self):
+        x = np.arange(10).astype(dtype=np.float)
+        y = xr.DataArray(da.from_array(np.stack((2 * x + 3, -x + 1), axis=1),
+                                       chunks=(5, 1)),
+                         dims=("time", "lon"),
+                         coords={"lon": [10, 20]},
+                         attrs={"units": "m"})
+
+        actual_p = ndpolyfit(x, y, deg=1)
+
+        self.assertIsInstance(actual_p.data, da.Array)
+        np.testing.assert_almost_equal(actual_p.values,
+                                       [[2.0, -1.0], [3.0, 1.0]])
+        np.testing.assert_equal(actual_p.coords["lon"].data, [10, 20])
+        self.assertEqual("m", actual_p.attrs["units"])
+
+    def test_10(self):
+        y = da.ones((10, 3), chunks=(10, 1))
+
+        with self.assertRaises(ValueError):
+            ndpolyfit(np.arange(5).astype(dtype=np.float), y, deg=1)
+        with self.assertRaises(ValueError):
+            ndpolyfit(np.arange(10).astype(dtype=np.float), y, deg=-1)
+        with self.assertRaises(TypeError):
+            ndpolyfit(np.arange(10).astype(dtype=np.float), y, deg=1.5)
+
+    def test_11(self):
+        x = [0.0, 1.0, 3.0, 4.0, 7.0]
+        y = [2 * i + 3 for i in x]
+
+        actual_p = ndpolyfit(x, y, deg=1)
+
+        np.testing.assert_almost_equal(actual_p, [2.0, 3.0])
+
 
 class test_internal_ndpolyval(TestCase):
 
@@ -417,6 +461,12 @@ class test_internal_ndpolyval(TestCase):
 
             np.testing.assert_almost_equal(y_actual, y_expected)
 
+    def test_07(self):
+        p = np.asarray([1.0, 0.0])
+        x = np.asarray([np.inf, -np.inf])
+
+        np.testing.assert_equal(_ndpolyval(p, x), x)
+
 
 class test_ndpolyval(TestCase):
 
@@ -518,7 +568,58 @@ class test_ndpolyval(TestCase):
                     np.power(x_nparr, deg - i)
 
             y_actual = ndpolyval(p, x, axis=axis)
-            np.testing.assert_almost_equal(y_actual.data, y_expected.data)
+            self.assertIsInstance(y_actual.data, da.Array)
+            self.assertEqual(data_shape, y_actual.shape)
+            y_computed = y_actual.values
+            self.assertEqual(y_computed.shape, y_actual.shape)
+            np.testing.assert_almost_equal(y_computed, y_expected.data)
+
+    def test_04(self):
+        p = np.asarray([2.0, 3.0])
+        x = np.linspace(-1.0, 1.0, 11)
+
+        y_numpy = ndpolyval(p, x, dtype=np.float32)
+        y_dask = ndpolyval(p, da.from_array(x, chunks=3), dtype=np.float32)
+
+        self.assertEqual(np.float32, y_numpy.dtype)
+        self.assertEqual(np.float32, y_dask.dtype)
+        self.assertEqual(np.float32, y_dask.values.dtype)
+        np.testing.assert_allclose(y_numpy, 2 * x + 3, rtol=1e-6)
+        np.testing.assert_allclose(y_dask, 2 * x + 3, rtol=1e-6)
+
+        for dtype in (np.float16, np.int32):
+            with self.assertRaises(TypeError):
+                ndpolyval(p, da.from_array(x, chunks=3), dtype=dtype)
+
+    def test_05(self):
+        p = da.random.random((2, 40, 40), chunks=(2, 10, 10))
+        x = np.linspace(-1.0, 1.0, 11)
+
+        y_actual = ndpolyval(p, da.from_array(x, chunks=5), axis=0)
+
+        self.assertIsInstance(y_actual.data, da.Array)
+        self.assertEqual(((11,), (10,) * 4, (10,) * 4), y_actual.data.chunks)
+        self.assertEqual(16, y_actual.data.npartitions)
+
+        p = p.compute()
+        y_expected = p[0] * x[:, None, None] + p[1]
+        np.testing.assert_almost_equal(y_actual.values, y_expected)
+
+    def test_06(self):
+        p = np.asarray([1.0, 2.0])
+
+        for x in (np.ones((3, 4)), np.asarray(1.0)):
+            with self.assertRaises(ValueError):
+                ndpolyval(p, x)
+            with self.assertRaises(ValueError):
+                ndpolyval(p, da.from_array(x))
+
+        p = np.ones((2, 3))
+        x = np.ones((5, 4))
+        with self.assertRaises(ValueError):
+            ndpolyval(p, x)
+        with self.assertRaises(ValueError):
+            ndpolyval(p, da.from_array(x))
 
 
 class test_detrend(TestCase):
@@ -580,3 +681,26 @@ class test_detrend(TestCase):
         y_detrended = detrend(y, x=x, axis=1)
 
         np.testing.assert_almost_equal(y_detrended + y_trend, y)
+
+    def test_05(self):
+        # Creating synthetic data
+        x = np.linspace(-8 * np.pi, 8 * np.pi, 33, dtype=np.float64)
+        y0 = 1.0 * x
+        y1 = np.sin(x)
+        y = np.tile((y0 + y1).reshape((1, -1, 1, 1)), (2, 1, 3, 4))
+
+        y_detrended = detrend(da.from_array(y, chunks=(1, 33, 3, 2)),
+                              x=x,
+                              axis=1)
+
+        self.assertIsInstance(y_detrended.data, da.Array)
+        np.testing.assert_almost_equal(y_detrended.values,
+                                       detrend(y, x=x, axis=1).values)
+
+        # The fitted polynomial is lazy as well and is evaluated together with
+        # the output, sharing the fit
+        self.assertIsInstance(y_detrended.attrs["p"], da.Array)
+        actual, actual_p = dask.compute(y_detrended, y_detrended.attrs["p"])
+        expected_p = ndpolyfit(x, y, deg=1, axis=1)
+        np.testing.assert_almost_equal(actual.values, y_detrended.values)
+        np.testing.assert_almost_equal(actual_p, expected_p.values)
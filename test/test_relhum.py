@@ -63,6 +63,28 @@ class Test_relhum(unittest.TestCase):
 
         assert np.allclose(relhum(t, q, p), self.rh_gt_2, atol=0.1)
 
+    def test_xarray_dask_input(self):
+        p = xr.DataArray(da.from_array(self.p_def, chunks=10))
+        t = xr.DataArray(da.from_array(self.t_def, chunks=10),
+                         name="temperature",
+                         attrs={"units": "K"})
+        q = xr.DataArray(da.from_array(self.q_def, chunks=10))
+
+        out = relhum(t, q, p)
+
+        assert isinstance(out.data, da.Array)
+        assert out.name is None
+        assert out.attrs == {"units": "K"}
+        assert np.allclose(out, self.rh_gt_2, atol=0.1)
+
+        # relhum interpolates a double precision table, so the output is in
+        # double precision like that of the NumPy path
+        out = relhum(t.astype(np.float32), q.astype(np.float32),
+                     p.astype(np.float32))
+
+        assert out.dtype == np.float64
+        assert out.values.dtype == np.float64
+
     def test_dask_unchunked_input(self):
         p = da.from_array(self.p_def)
         t = da.from_array(self.t_def)
@@ -107,6 +129,26 @@ class Test_relhum_water(unittest.TestCase):
 
         assert np.allclose(relhum_water(t, q, p), self.rh_gt_1, atol=0.1)
 
+    def test_xarray_dask_input(self):
+        p = xr.DataArray(da.from_array([1000. * 100] * 4, chunks=2))
+        t = xr.DataArray(da.from_array([18. + 273.15] * 4, chunks=2),
+                         name="temperature",
+                         attrs={"units": "K"})
+        q = xr.DataArray(da.from_array([6. / 1000.] * 4, chunks=2))
+
+        out = relhum_water(t, q, p)
+
+        assert isinstance(out.data, da.Array)
+        assert out.name is None
+        assert out.attrs == {"units": "K"}
+        assert np.allclose(out, self.rh_gt_1, atol=0.1)
+
+        out = relhum_water(t.astype(np.float32), q.astype(np.float32),
+                           p.astype(np.float32))
+
+        assert out.dtype == np.float32
+        assert out.values.dtype == np.float32
+
 
 class Test_relhum_ice(unittest.TestCase):
 
@@ -119,3 +161,23 @@ class Test_relhum_ice(unittest.TestCase):
         p = 1000. * 100.
 
         assert np.allclose(relhum_ice(tk, w, p), self.rh_gt_1, atol=0.1)
+
+    def test_xarray_dask_input(self):
+        p = xr.DataArray(da.from_array([1000. * 100.] * 4, chunks=2))
+        tk = xr.DataArray(da.from_array([-5. + 273.15] * 4, chunks=2),
+                          name="temperature",
+                          attrs={"units": "K"})
+        w = xr.DataArray(da.from_array([3.7 / 1000.] * 4, chunks=2))
+
+        out = relhum_ice(tk, w, p)
+
+        assert isinstance(out.data, da.Array)
+        assert out.name is None
+        assert out.attrs == {"units": "K"}
+        assert np.allclose(out, self.rh_gt_1, atol=0.1)
+
+        out = relhum_ice(tk.astype(np.float32), w.astype(np.float32),
+                         p.astype(np.float32))
+
+        assert out.dtype == np.float32
+        assert out.values.dtype == np.float32